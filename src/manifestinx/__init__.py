@@ -14,6 +14,7 @@ from .pack_system import (
     PackHandle,
     ValidationIssue,
     ValidationReport,
+    iter_validation_issues,
     load_pack,
     validate_pack,
 )
@@ -24,5 +25,6 @@ __all__ = [
     "ValidationIssue",
     "ValidationReport",
     "validate_pack",
+    "iter_validation_issues",
     "load_pack",
 ]
@@ -0,0 +1,85 @@
+"""Input text canonicalization (opt-in, versioned).
+
+Canonicalization runs in front of feature extraction so that equivalent drafts
+(NFC vs NFD, CRLF vs LF, trailing blanks) hash to the same bytes.
+
+Rules for "text_canon_v1":
+- Unicode normalization form NFC.
+- Newlines: CRLF and lone CR become LF.
+- Whitespace: trailing spaces/tabs are stripped from every line.
+- No other transforms (no case folding, no inner-whitespace collapsing).
+
+Rules are frozen per version; any change ships as a new version id so that
+recorded results can be replayed under the rules that produced them.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from typing import Callable, Iterable, Iterator
+
+CANONICALIZATION_VERSION = "text_canon_v1"
+
+
+def _is_canonical_ascii_v1(text: str) -> bool:
+    """Fast path: pure-ASCII text with nothing for v1 to rewrite.
+
+    ASCII is NFC-invariant, so only newline and trailing-blank rules apply.
+    Every check is a single C-level scan; no copies are made.
+    """
+    return (
+        text.isascii()
+        and "\r" not in text
+        and " \n" not in text
+        and "\t\n" not in text
+        and not text.endswith((" ", "\t"))
+    )
+
+
+def _canonicalize_v1(text: str) -> str:
+    if _is_canonical_ascii_v1(text):
+        return text
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if not text.isascii():
+        text = unicodedata.normalize("NFC", text)
+    return "\n".join(ln.rstrip(" \t") for ln in text.split("\n"))
+
+
+# Version id -> rules; each entry is frozen once released
+_RULES: dict[str, Callable[[str], str]] = {
+    "text_canon_v1": _canonicalize_v1,
+}
+
+SUPPORTED_VERSIONS: tuple[str, ...] = tuple(_RULES)
+
+
+def _resolve_version(version: str | bool) -> str:
+    if version is True:
+        return CANONICALIZATION_VERSION
+    if isinstance(version, str) and version in _RULES:
+        return version
+    raise ValueError(f"Unsupported canonicalization version: {version!r}")
+
+
+class _Canonicalizer:
+    """Callable bound to one canonicalization rules version."""
+
+    def __init__(self, version: str | bool = CANONICALIZATION_VERSION) -> None:
+        self.version = _resolve_version(version)
+        self._rules = _RULES[self.version]
+
+    def __call__(self, text: str) -> str:
+        return self._rules(text)
+
+
+def canonicalize_text(text: str, version: str | bool = CANONICALIZATION_VERSION) -> str:
+    """Return the canonical form of text under the given rules version."""
+    return _RULES[_resolve_version(version)](text)
+
+
+def canonicalize_batch(
+    texts: Iterable[str], version: str | bool = CANONICALIZATION_VERSION
+) -> Iterator[str]:
+    """Canonicalize texts lazily under one rules version."""
+    return map(_RULES[_resolve_version(version)], texts)
@@ -4,7 +4,7 @@ This CLI is intentionally minimal and core-focused.
 
 Commands:
 - manifestinx --help
-- manifestinx pack validate <path>
+- manifestinx pack validate <path> [--json] [--check-unpinned] [--max-issues N | --fail-fast]
 """
 
 from __future__ import annotations
@@ -17,8 +17,19 @@ from pathlib import Path
 from .pack_system import validate_pack
 
 
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if n <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return n
+
+
 def _cmd_pack_validate(args: argparse.Namespace) -> int:
-    report = validate_pack(Path(args.path))
+    max_issues = 1 if args.fail_fast else args.max_issues
+    report = validate_pack(Path(args.path), max_issues=max_issues, check_unpinned=args.check_unpinned)
     if args.json:
         print(json.dumps(report.to_dict(), indent=2, sort_keys=True))
     else:
@@ -42,6 +53,14 @@ def build_parser() -> argparse.ArgumentParser:
     v = pack_sub.add_parser("validate", help="Validate a local pack")
     v.add_argument("path", help="Path to pack root directory")
     v.add_argument("--json", action="store_true", help="Emit JSON report")
+    v.add_argument(
+        "--check-unpinned",
+        action="store_true",
+        help="Also report files present in the pack but not pinned, and escaping symlinks",
+    )
+    limit = v.add_mutually_exclusive_group()
+    limit.add_argument("--max-issues", type=_positive_int, default=None, metavar="N", help="Stop after N issues")
+    limit.add_argument("--fail-fast", action="store_true", help="Stop at the first issue")
     v.set_defaults(_fn=_cmd_pack_validate)
 
     return p
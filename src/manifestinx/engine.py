@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, TextIO
 
 from pathlib import Path
+from .canonicalize import _Canonicalizer
 from .pack_system import PackHandle, ValidationReport, load_pack as _load_pack, validate_pack as _validate_pack
 
 import hashlib
+import json
 
 # Core MUST be domain-agnostic:
 # - No product taxonomy (drift/avoidance/...)
@@ -16,11 +18,14 @@ import hashlib
 # We keep a deterministic feature vector as a core primitive.
 FEATURE_DIMS: tuple[str, ...] = ("d01", "d02", "d03", "d04", "d05")
 
+_FEATURE_DIMS_JSON = json.dumps(list(FEATURE_DIMS), separators=(",", ":"))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CoreResult:
     ok: bool
-    input_text: str
+    # Raw input echo; None in lean mode (see input_sha256 / input_bytes)
+    input_text: Optional[str]
     # Deterministic, stable ordering
     feature_dim_order: tuple[str, ...]
     feature_vector: tuple[float, ...]
@@ -28,28 +33,68 @@ class CoreResult:
     # Optional pack-defined identifier; core does not compute this
     pack_identifier: Optional[str] = None
     diagnostics: Optional[Mapping[str, Any]] = None
+    # Canonicalization rules version applied before hashing (None = raw input)
+    canonicalization: Optional[str] = None
+    # Lean mode: sha256 hex and UTF-8 byte length of the raw input
+    input_sha256: Optional[str] = None
+    input_bytes: Optional[int] = None
+    # Lean mode: sha256 hex the feature vector was derived from (post-canonicalization);
+    # equals Engine.input_digest() and is the routing/dedup key
+    input_digest: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
-        out: dict[str, Any] = {
-            "ok": self.ok,
-            "input_text": self.input_text,
-            "feature_dim_order": list(self.feature_dim_order),
-            "feature_vector": list(self.feature_vector),
-            "dominant_dim": self.dominant_dim,
-        }
+        out: dict[str, Any] = {"ok": self.ok}
+        if self.input_text is not None:
+            out["input_text"] = self.input_text
+        else:
+            out["input_sha256"] = self.input_sha256
+            out["input_bytes"] = self.input_bytes
+            out["input_digest"] = self.input_digest
+        out["feature_dim_order"] = list(self.feature_dim_order)
+        out["feature_vector"] = list(self.feature_vector)
+        out["dominant_dim"] = self.dominant_dim
         if self.pack_identifier is not None:
             out["pack_identifier"] = self.pack_identifier
         if self.diagnostics is not None:
             out["diagnostics"] = dict(self.diagnostics)
+        if self.canonicalization is not None:
+            out["canonicalization"] = self.canonicalization
         return out
 
+    def write_json(self, stream: TextIO) -> None:
+        """Write to_dict() as compact JSON to stream without building the dict."""
+        w = stream.write
+        w('{"ok":true' if self.ok else '{"ok":false')
+        if self.input_text is not None:
+            w(',"input_text":')
+            w(json.dumps(self.input_text))
+        else:
+            w(f',"input_sha256":{json.dumps(self.input_sha256)},"input_bytes":{json.dumps(self.input_bytes)}')
+            w(f',"input_digest":{json.dumps(self.input_digest)}')
+        w(',"feature_dim_order":')
+        w(_FEATURE_DIMS_JSON if self.feature_dim_order == FEATURE_DIMS else json.dumps(list(self.feature_dim_order)))
+        w(',"feature_vector":[')
+        w(",".join(float.__repr__(float(v)) for v in self.feature_vector))
+        w('],"dominant_dim":')
+        w(json.dumps(self.dominant_dim))
+        if self.pack_identifier is not None:
+            w(',"pack_identifier":')
+            w(json.dumps(self.pack_identifier))
+        if self.diagnostics is not None:
+            w(',"diagnostics":')
+            w(json.dumps(dict(self.diagnostics), separators=(",", ":")))
+        if self.canonicalization is not None:
+            w(',"canonicalization":')
+            w(json.dumps(self.canonicalization))
+        w("}")
+
 
 class Engine:
     """
     v2.0.1 core-only engine.
 
     Core responsibilities:
-    - deterministic canonicalization (if present elsewhere in your codebase)
+    - deterministic canonicalization (opt-in, versioned; see manifestinx.canonicalize)
     - deterministic feature extraction (domain-agnostic)
     - pack loading/validation via Pack System v0.1 (handled in engine facade or pack_system module)
 
@@ -65,25 +110,124 @@ class Engine:
 
     # ---- pack-system façade (v0.1 local-only) ----
 
-    def validate_pack(self, path: str | Path) -> ValidationReport:
-        return _validate_pack(path)
+    def validate_pack(self, path: str | Path, *, check_unpinned: bool = False) -> ValidationReport:
+        return _validate_pack(path, check_unpinned=check_unpinned)
 
-    def load_pack(self, path: str | Path) -> PackHandle:
-        return _load_pack(path)
+    def load_pack(self, path: str | Path, *, check_unpinned: bool = False) -> PackHandle:
+        return _load_pack(path, check_unpinned=check_unpinned)
 
     # ---- core deterministic feature extraction ----
 
-    def run_text(self, text: str, *, diagnostics: bool = False) -> dict[str, Any]:
+    def run_text(
+        self,
+        text: str,
+        *,
+        diagnostics: bool = False,
+        canonicalize: bool | str = False,
+        lean: bool = False,
+    ) -> dict[str, Any]:
         """
         Deterministically convert input text into a domain-agnostic feature vector.
 
+        If canonicalize is True (or a supported version id), the text is
+        canonicalized before hashing and the rules version is recorded in the
+        result under "canonicalization". input_text always echoes the raw input.
+
+        If lean is True, input_text is replaced by input_sha256 / input_bytes
+        (sha256 hex and UTF-8 length of the raw input) and input_digest (the
+        sha256 hex the feature vector was derived from, i.e. after
+        canonicalization; use it for routing and dedup).
+
         NOTE:
         - No template_id is produced by core.
         - Any mapping to pack-specific identifiers must be performed by pack-defined pipeline logic.
         """
+        return next(self._iter_results((text,), diagnostics, canonicalize, lean)).to_dict()
+
+    def run_batch(
+        self,
+        texts: Iterable[str],
+        *,
+        diagnostics: bool = False,
+        canonicalize: bool | str = False,
+        lean: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily apply run_text to each input, in order."""
+        for result in self._iter_results(texts, diagnostics, canonicalize, lean):
+            yield result.to_dict()
+
+    def write_batch(
+        self,
+        texts: Iterable[str],
+        stream: TextIO,
+        *,
+        diagnostics: bool = False,
+        canonicalize: bool | str = False,
+        lean: bool = False,
+    ) -> int:
+        """Stream one compact JSON line per input to stream; returns the count.
+
+        Results are serialized as they are produced; no intermediate dicts are
+        built and only one result is alive at a time. Pass lean=True to drop
+        the raw input echo from each line, as with run_batch.
+        """
+        n = 0
+        for result in self._iter_results(texts, diagnostics, canonicalize, lean):
+            result.write_json(stream)
+            stream.write("\n")
+            n += 1
+        return n
+
+    def input_digest(self, text: str, *, canonicalize: bool | str = False) -> str:
+        """sha256 hex of the bytes the feature vector is derived from.
+
+        Stable routing/dedup key: identical (canonicalized) inputs share it.
+        """
         input_text = text if isinstance(text, str) else str(text)
+        if canonicalize:
+            input_text = _Canonicalizer(canonicalize)(input_text)
+        return hashlib.sha256(input_text.encode("utf-8")).hexdigest()
+
+    def _iter_results(
+        self,
+        texts: Iterable[str],
+        diagnostics: bool,
+        canonicalize: bool | str,
+        lean: bool,
+    ) -> Iterator[CoreResult]:
+        canon = _Canonicalizer(canonicalize) if canonicalize else None
+        for text in texts:
+            input_text = text if isinstance(text, str) else str(text)
+            if canon is None:
+                yield self._run_one(input_text, input_text, diagnostics, None, lean)
+            else:
+                yield self._run_one(input_text, canon(input_text), diagnostics, canon.version, lean)
 
-        vec = self._compute_feature_vector(input_text)
+    def _run_one(
+        self,
+        input_text: str,
+        hashed_text: str,
+        diagnostics: bool,
+        canon_version: Optional[str],
+        lean: bool,
+    ) -> CoreResult:
+        hashed_bytes = hashed_text.encode("utf-8")
+        digest = hashlib.sha256(hashed_bytes)
+        input_sha256: Optional[str] = None
+        input_bytes: Optional[int] = None
+        input_digest: Optional[str] = None
+        if lean:
+            input_digest = digest.hexdigest()
+            if hashed_text is input_text:
+                # Raw input was hashed as-is; reuse that digest
+                input_sha256 = input_digest
+                input_bytes = len(hashed_bytes)
+            else:
+                raw = input_text.encode("utf-8")
+                input_sha256 = hashlib.sha256(raw).hexdigest()
+                input_bytes = len(raw)
+
+        vec = self._feature_vector_from_digest(digest.digest())
         dominant_idx = max(range(len(vec)), key=lambda i: vec[i])
         dominant_dim = FEATURE_DIMS[dominant_idx]
 
@@ -94,30 +238,31 @@ class Engine:
                 "dominant_index": dominant_idx,
             }
 
-        result = CoreResult(
+        return CoreResult(
             ok=True,
-            input_text=input_text,
+            input_text=None if lean else input_text,
             feature_dim_order=FEATURE_DIMS,
             feature_vector=tuple(vec),
             dominant_dim=dominant_dim,
             diagnostics=diag,
+            canonicalization=canon_version,
+            input_sha256=input_sha256,
+            input_bytes=input_bytes,
+            input_digest=input_digest,
         )
-        return result.to_dict()
 
-    def _compute_feature_vector(self, input_text: str) -> Sequence[float]:
+    @staticmethod
+    def _feature_vector_from_digest(digest: bytes) -> Sequence[float]:
         """
         Deterministic, domain-agnostic feature vector.
 
-        Uses sha256 over raw UTF-8 bytes of the input text and converts the digest
-        into a fixed-length numeric vector in a stable way.
+        Converts the sha256 digest of the (optionally canonicalized) input's
+        UTF-8 bytes into a fixed-length numeric vector in a stable way.
 
         - No product taxonomy
         - No template mapping
         - No external deps
         """
-        b = input_text.encode("utf-8")
-        digest = hashlib.sha256(b).digest()  # 32 bytes
-
         # Turn digest into 5 stable dimensions using 4-byte chunks.
         # (20 bytes used, leaving the remainder unused by design.)
         vals = []
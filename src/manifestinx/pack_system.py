@@ -16,6 +16,13 @@ Validation in v0.1:
 - Enforces required keys + types.
 - Validates relpath safety (no absolute, no traversal, no drive letters).
 - Validates sha256 pins (raw bytes).
+- Checks each pin with a direct lstat/open as it is read from the manifest.
+- With check_unpinned=True, walks the pack tree once with os.scandir after all
+  pins are checked and reports files present but not pinned (UNPINNED_FILE) and
+  symlinks resolving outside the pack root (SYMLINK_ESCAPE); names matching
+  tree_ignore (default: VCS metadata, __pycache__, .DS_Store) are skipped.
+- Streams the manifest: `files` entries are checked as they are read, and
+  iter_validation_issues() yields issues incrementally (max_issues/fail_fast).
 - Future-proofing fields are validated for type/format only:
   - version
   - engine_compat.min_version / engine_compat.max_version
@@ -25,12 +32,15 @@ No network loading in v0.1.
 
 from __future__ import annotations
 
+import fnmatch
 import hashlib
 import json
+import os
 import re
+import stat
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, MutableMapping
+from typing import Any, Iterable, Iterator, Mapping, MutableMapping
 
 
 _SHA256_HEX_RE = re.compile(r"^[a-f0-9]{64}$")
@@ -90,134 +100,633 @@ def _is_safe_relpath(p: str) -> bool:
     return True
 
 
-def _read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+def _normalize_relpath(p: str) -> str:
+    """Collapse empty and '.' segments so manifest keys match tree relpaths."""
+    return "/".join(x for x in p.split("/") if x and x != ".")
 
 
-def _load_manifest(pack_root: Path) -> MutableMapping[str, Any]:
-    mf = pack_root / "pack_manifest.json"
+_MANIFEST_NAME = "pack_manifest.json"
+
+# Entry names skipped by the tree walk (fnmatch patterns, matched per path segment)
+DEFAULT_TREE_IGNORE: tuple[str, ...] = (".git", ".hg", ".svn", "__pycache__", ".DS_Store")
+
+# Entry kinds
+_KIND_FILE = "file"
+_KIND_DIR = "dir"
+_KIND_OTHER = "other"
+_KIND_MISSING = "missing"
+_KIND_ESCAPE = "escape"  # resolves outside the pack root
+_KIND_BROKEN = "broken"  # dangling symlink
+
+
+@dataclass(frozen=True)
+class _TreeEntry:
+    kind: str
+    is_symlink: bool = False
+
+
+# One shared instance per kind; tree walks never allocate per-file entries
+_ENTRY_FILE = _TreeEntry(_KIND_FILE)
+_ENTRY_DIR = _TreeEntry(_KIND_DIR)
+_ENTRY_OTHER = _TreeEntry(_KIND_OTHER)
+_LINK_FILE = _TreeEntry(_KIND_FILE, is_symlink=True)
+_LINK_DIR = _TreeEntry(_KIND_DIR, is_symlink=True)
+_LINK_OTHER = _TreeEntry(_KIND_OTHER, is_symlink=True)
+_LINK_ESCAPE = _TreeEntry(_KIND_ESCAPE, is_symlink=True)
+_LINK_BROKEN = _TreeEntry(_KIND_BROKEN, is_symlink=True)
+
+
+def _within(root_str: str, target: str) -> bool:
+    return target == root_str or target.startswith(root_str + os.sep)
+
+
+def _classify_link(root_str: str, path: str) -> _TreeEntry:
+    target = os.path.realpath(path)
+    if not _within(root_str, target):
+        return _LINK_ESCAPE
+    if os.path.isfile(target):
+        return _LINK_FILE
+    if os.path.isdir(target):
+        return _LINK_DIR
+    if os.path.lexists(target):
+        return _LINK_OTHER
+    return _LINK_BROKEN
+
+
+class _PinResolver:
+    """Classifies pinned relpaths with direct lstat calls (no tree walk).
+
+    Parent directories are resolved once each and cached, so a path reaching
+    through a directory symlink that leaves the root is reported as an escape.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root_str = str(root)
+        self._dirs: dict[str, str] = {"": _KIND_DIR}
+
+    def _dir_kind(self, dir_rel: str) -> str:
+        kind = self._dirs.get(dir_rel)
+        if kind is None:
+            target = os.path.realpath(os.path.join(self._root_str, dir_rel))
+            if not _within(self._root_str, target):
+                kind = _KIND_ESCAPE
+            elif os.path.isdir(target):
+                kind = _KIND_DIR
+            else:
+                kind = _KIND_MISSING
+            self._dirs[dir_rel] = kind
+        return kind
+
+    def kind(self, relpath: str) -> str:
+        """Return the kind of a normalized relpath."""
+        dir_kind = self._dir_kind(relpath.rpartition("/")[0])
+        if dir_kind != _KIND_DIR:
+            return dir_kind
+        path = self.path_of(relpath)
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return _KIND_MISSING
+        if stat.S_ISREG(st.st_mode):
+            return _KIND_FILE
+        if stat.S_ISLNK(st.st_mode):
+            return _classify_link(self._root_str, path).kind
+        return _KIND_OTHER
+
+    def path_of(self, relpath: str) -> str:
+        return os.path.join(self._root_str, relpath)
+
+
+def _iter_tree(root: Path, ignore: Iterable[str] = DEFAULT_TREE_IGNORE) -> Iterator[tuple[str, _TreeEntry]]:
+    """Yield (relpath, entry) for every non-directory entry under root.
+
+    One os.scandir per directory; regular entries are classified from the
+    directory entry type, so no per-file stat is needed. Entries come out in
+    lexicographic relpath order while holding only the directories on the
+    current path in memory. Symlinked directories are not descended (the real
+    directory is walked); names matching ignore are skipped entirely.
+    """
+    root_str = str(root)
+    patterns = tuple(ignore)
+
+    def children(prefix: str, dirpath: str) -> Iterator[tuple[str, str, _TreeEntry]]:
+        out: list[tuple[str, str, str, _TreeEntry]] = []
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            return iter(())
+        with it:
+            for de in it:
+                name = de.name
+                if patterns and any(fnmatch.fnmatchcase(name, pat) for pat in patterns):
+                    continue
+                try:
+                    if de.is_symlink():
+                        entry = _classify_link(root_str, de.path)
+                    elif de.is_dir(follow_symlinks=False):
+                        entry = _ENTRY_DIR
+                    elif de.is_file(follow_symlinks=False):
+                        entry = _ENTRY_FILE
+                    else:
+                        entry = _ENTRY_OTHER
+                except OSError:
+                    entry = _ENTRY_OTHER
+                # Sorting dirs as "name/" makes per-directory order match global relpath order
+                key = name + "/" if entry is _ENTRY_DIR else name
+                out.append((key, prefix + name, de.path, entry))
+        out.sort(key=lambda t: t[0])
+        return ((rel, path, entry) for _, rel, path, entry in out)
+
+    stack = [children("", root_str)]
+    while stack:
+        nxt = next(stack[-1], None)
+        if nxt is None:
+            stack.pop()
+            continue
+        rel, path, entry = nxt
+        if entry is _ENTRY_DIR:
+            stack.append(children(rel + "/", path))
+        elif entry.kind != _KIND_DIR:
+            yield rel, entry
+
+
+def _manifest_path(pack_root: Path) -> Path:
+    mf = pack_root / _MANIFEST_NAME
     if not mf.exists() or not mf.is_file():
         raise FileNotFoundError(f"Missing pack_manifest.json at: {mf}")
-    obj = _read_json(mf)
+    return mf
+
+
+def _duplicate_key_error(key: str) -> ValueError:
+    return ValueError(f"Duplicate key in pack_manifest.json: {key!r}")
+
+
+def _first_repeated_key(pairs: list[tuple[str, Any]], keys: Iterable[str] | None = None) -> str | None:
+    seen: set[str] = set()
+    for k, _ in pairs:
+        if k in seen and (keys is None or k in keys):
+            return k
+        seen.add(k)
+    return None
+
+
+def _load_manifest(pack_root: Path) -> MutableMapping[str, Any]:
+    """Parse the manifest; a repeated key is an error only where it shadows pins.
+
+    Elsewhere the last value wins, as with plain json.loads (v2.0.1 behavior).
+    """
+    text = _manifest_path(pack_root).read_text(encoding="utf-8")
+    # id -> (object, its pairs); holding the object keeps its id unique
+    repeated: dict[int, tuple[dict[str, Any], list[tuple[str, Any]]]] = {}
+
+    def hook(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+        out = dict(pairs)
+        if len(out) != len(pairs):
+            repeated[id(out)] = (out, pairs)
+        return out
+
+    obj = json.loads(text, object_pairs_hook=hook)
     if not isinstance(obj, dict):
         raise ValueError("pack_manifest.json must be a JSON object")
+    if id(obj) in repeated:
+        key = _first_repeated_key(repeated[id(obj)][1], ("files",))
+        if key is not None:
+            raise _duplicate_key_error(key)
+    files = obj.get("files")
+    if isinstance(files, dict) and id(files) in repeated:
+        raise _duplicate_key_error(_first_repeated_key(repeated[id(files)][1]))
     return obj
 
 
-def validate_pack(pack_root: str | Path) -> ValidationReport:
-    root = Path(pack_root).expanduser().resolve()
-    issues: list[ValidationIssue] = []
+_WS_RE = re.compile(r"[ \t\n\r]*")
+_NUMBER_RUN_RE = re.compile(r"[-+0-9.eE]*")
+# Fast path for the common `"relpath": "sha256"` member with no escapes
+_SIMPLE_MEMBER_RE = re.compile(r'[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*:[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*([,}])')
 
+
+class _ManifestStream:
+    """Incremental reader for pack_manifest.json.
+
+    Walks the top-level object key by key and can stream the entries of a
+    nested object (used for `files`) without materializing it. Scalars and
+    other values are decoded with the stdlib JSON decoder on a sliding buffer.
+    Malformed JSON raises ValueError (json.JSONDecodeError).
+    """
+
+    def __init__(self, fh: Any, chunk_size: int = 1 << 16) -> None:
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0  # characters dropped from the front of _buf
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        # Read at least as much as is buffered so large values grow geometrically
+        chunk = self._fh.read(max(self._chunk_size, len(self._buf) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = _WS_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, ch: str) -> None:
+        got = self._peek()
+        if got != ch:
+            raise json.JSONDecodeError(f"Expecting '{ch}'", self._buf, self._pos)
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        ch = self._peek()
+        if ch == "-" or ch.isdigit():
+            # A number touching the buffer edge may continue in the next chunk
+            while _NUMBER_RUN_RE.match(self._buf, self._pos).end() == len(self._buf) and self._fill():
+                pass
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            self._pos = end
+            return obj
+
+    def _iter_members(self) -> Iterator[str]:
+        """Yield member keys of the object at the cursor; caller consumes each value."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        seen: set[str] = set()
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buf, self._pos)
+            # A second `files` would shadow every pin; other keys: last one wins
+            if key == "files" and key in seen:
+                raise _duplicate_key_error(key)
+            seen.add(key)
+            self._expect(":")
+            yield key
+            sep = self._peek()
+            self._pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+    def iter_object(self) -> Iterator[tuple[str, Any]]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        match = _SIMPLE_MEMBER_RE.match
+        while True:
+            m = match(self._buf, self._pos)
+            if m is not None and m.end() < len(self._buf):
+                self._pos = m.end()
+                yield m.group(1), m.group(2)
+                if m.group(3) == "}":
+                    return
+                continue
+            # General path: escapes, non-string values, or a member split across chunks
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buf, self._pos)
+            self._expect(":")
+            value = self.read_value()
+            yield key, value
+            sep = self._peek()
+            self._pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+    def is_object_next(self) -> bool:
+        return self._peek() == "{"
+
+    def iter_top_level(self) -> Iterator[str]:
+        if not self.is_object_next():
+            raise ValueError("pack_manifest.json must be a JSON object")
+        yield from self._iter_members()
+        if self._peek() != "":
+            raise json.JSONDecodeError("Extra data", self._buf, self._pos)
+
+
+class _ManifestReadError(Exception):
+    """Wraps I/O and decode errors raised while streaming the manifest."""
+
+
+def _read_error(stream: _ManifestStream | None, e: Exception) -> _ManifestReadError:
+    if stream is not None and isinstance(e, json.JSONDecodeError):
+        # Report the position in the file, not in the sliding buffer
+        return _ManifestReadError(f"{e.msg}: char {stream._offset + e.pos}")
+    return _ManifestReadError(str(e))
+
+
+class _LazyObject:
+    """Single-use view over a streamed JSON object (mirrors dict.items())."""
+
+    def __init__(self, stream: _ManifestStream) -> None:
+        self._stream = stream
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        try:
+            yield from self._stream.iter_object()
+        except (OSError, ValueError) as e:
+            raise _read_error(self._stream, e) from e
+
+
+def _stream_manifest(mf: Path) -> Iterator[tuple[str, Any]]:
+    """Yield top-level (key, value) pairs; `files` is yielded as a _LazyObject.
+
+    The lazy value must be consumed before requesting the next pair.
+    """
+    stream: _ManifestStream | None = None
     try:
-        manifest = _load_manifest(root)
-    except Exception as e:
-        return ValidationReport(False, (ValidationIssue("MANIFEST_READ_ERROR", str(e), "pack_manifest.json"),))
+        with open(mf, "r", encoding="utf-8") as fh:
+            stream = _ManifestStream(fh)
+            for key in stream.iter_top_level():
+                if key == "files" and stream.is_object_next():
+                    yield key, _LazyObject(stream)
+                else:
+                    yield key, stream.read_value()
+    except (OSError, ValueError) as e:
+        raise _read_error(stream, e) from e
+
+
+_HEADER_KEYS = ("schema_version", "pack_id", "version", "engine_compat")
 
+
+def _check_header(key: str, value: Any) -> Iterator[ValidationIssue]:
     # Required fields
-    schema_version = manifest.get("schema_version")
-    if schema_version != "pack_manifest_v0.1":
-        issues.append(
-            ValidationIssue(
+    if key == "schema_version":
+        if value != "pack_manifest_v0.1":
+            yield ValidationIssue(
                 "SCHEMA_VERSION",
                 "schema_version must equal 'pack_manifest_v0.1'",
                 "schema_version",
             )
-        )
 
-    pack_id = manifest.get("pack_id")
-    if not isinstance(pack_id, str) or not pack_id.strip():
-        issues.append(ValidationIssue("PACK_ID", "pack_id must be a non-empty string", "pack_id"))
+    elif key == "pack_id":
+        if not isinstance(value, str) or not value.strip():
+            yield ValidationIssue("PACK_ID", "pack_id must be a non-empty string", "pack_id")
 
     # Optional future-proofing fields (format/type only)
-    version = manifest.get("version")
-    if version is not None:
-        if not isinstance(version, str) or not _SEMVER_LIKE_RE.match(version):
-            issues.append(
-                ValidationIssue(
+    elif key == "version":
+        if value is not None:
+            if not isinstance(value, str) or not _SEMVER_LIKE_RE.match(value):
+                yield ValidationIssue(
                     "VERSION_FORMAT",
                     "version must be a SemVer-like string (e.g., 1.2.3 or 1.2.3-rc.1)",
                     "version",
                 )
-            )
 
-    engine_compat = manifest.get("engine_compat")
-    if engine_compat is not None:
-        if not isinstance(engine_compat, dict):
-            issues.append(
-                ValidationIssue(
+    elif key == "engine_compat":
+        if value is not None:
+            if not isinstance(value, dict):
+                yield ValidationIssue(
                     "ENGINE_COMPAT_TYPE",
                     "engine_compat must be an object",
                     "engine_compat",
                 )
-            )
-        else:
-            for k in ("min_version", "max_version"):
-                v = engine_compat.get(k)
-                if v is None:
-                    continue
-                if not isinstance(v, str) or not _SEMVER_LIKE_RE.match(v):
-                    issues.append(
-                        ValidationIssue(
+            else:
+                for k in ("min_version", "max_version"):
+                    v = value.get(k)
+                    if v is None:
+                        continue
+                    if not isinstance(v, str) or not _SEMVER_LIKE_RE.match(v):
+                        yield ValidationIssue(
                             "ENGINE_COMPAT_FORMAT",
                             f"engine_compat.{k} must be a SemVer-like string",
                             f"engine_compat.{k}",
                         )
-                    )
 
-    files = manifest.get("files")
-    if not isinstance(files, dict) or not files:
-        issues.append(ValidationIssue("FILES", "files must be a non-empty object mapping relpath -> sha256", "files"))
-        return ValidationReport(False, tuple(issues))
 
-    # Validate file pins
-    for relpath, sha in files.items():
-        if not isinstance(relpath, str) or not _is_safe_relpath(relpath):
-            issues.append(ValidationIssue("PATH_UNSAFE", "file path must be a safe relative path", str(relpath)))
-            continue
-        if not isinstance(sha, str) or not _SHA256_HEX_RE.match(sha):
-            issues.append(ValidationIssue("SHA256_FORMAT", "sha256 must be 64 lowercase hex chars", relpath))
-            continue
+def _iter_manifest_issues(
+    root: Path,
+    items: Iterator[tuple[str, Any]],
+    check_unpinned: bool = False,
+    tree_ignore: Iterable[str] = DEFAULT_TREE_IGNORE,
+) -> Iterator[ValidationIssue]:
+    """Validate a manifest given as a stream of top-level (key, value) pairs.
 
-        fpath = (root / relpath).resolve()
-        # Ensure path stays within pack root
-        try:
-            fpath.relative_to(root)
-        except Exception:
-            issues.append(ValidationIssue("PATH_TRAVERSAL", "file resolves outside pack root", relpath))
-            continue
+    File pins are checked while `files` is being read. Header fields are held
+    until `files` starts (or the manifest ends) so a repeated header key is
+    judged on its last value, as json.loads would; they are reported in the
+    historical order. A header key repeated on both sides of `files` is
+    checked once per side.
+    """
+    seen: set[str] = set()
+    headers: dict[str, Any] = {}
+    entrypoints: Any = None
+    files_seen = False
+    files_ok = False
+    resolver = _PinResolver(root)
+    # Normalized pinned relpaths; the only per-file state kept across the run
+    pinned: set[str] = set()
+    # Raw spelling for the rare pins whose relpath is not already normalized
+    aliases: dict[str, str] = {}
+    # Unsafe relpaths are never pinned; kept only to catch exact duplicates
+    unsafe: set[str] = set()
+
+    def check_headers() -> Iterator[ValidationIssue]:
+        for k in _HEADER_KEYS:
+            if k in headers:
+                seen.add(k)
+                yield from _check_header(k, headers.pop(k))
+
+    for key, value in items:
+        if key in _HEADER_KEYS:
+            headers[key] = value
+        elif key == "entrypoints":
+            entrypoints = value
+        elif key == "files":
+            yield from check_headers()
+            files_seen = True
+            if not isinstance(value, (dict, _LazyObject)):
+                yield ValidationIssue("FILES", "files must be a non-empty object mapping relpath -> sha256", "files")
+                continue
+
+            # Validate file pins
+            n = 0
+            for relpath, sha in value.items():
+                n += 1
+                if not isinstance(relpath, str) or not _is_safe_relpath(relpath):
+                    if relpath in unsafe:
+                        # Exact duplicate key; only reachable when streaming (the
+                        # loaded-dict path rejects it while parsing).
+                        raise _ManifestReadError(str(_duplicate_key_error(relpath)))
+                    unsafe.add(relpath)
+                    yield ValidationIssue("PATH_UNSAFE", "file path must be a safe relative path", str(relpath))
+                    continue
+                norm = _normalize_relpath(relpath)
+                if norm in pinned:
+                    if aliases.get(norm, norm) == relpath:
+                        raise _ManifestReadError(str(_duplicate_key_error(relpath)))
+                    yield ValidationIssue("DUPLICATE_PIN", "file path pinned more than once under different spellings", relpath)
+                    continue
+                pinned.add(norm)
+                if norm != relpath:
+                    aliases[norm] = relpath
+                if not isinstance(sha, str) or not _SHA256_HEX_RE.match(sha):
+                    yield ValidationIssue("SHA256_FORMAT", "sha256 must be 64 lowercase hex chars", relpath)
+                    continue
 
-        if not fpath.exists() or not fpath.is_file():
-            issues.append(ValidationIssue("FILE_MISSING", "pinned file missing", relpath))
-            continue
+                # Ensure path stays within pack root
+                kind = resolver.kind(norm)
+                if kind == _KIND_ESCAPE:
+                    yield ValidationIssue("PATH_TRAVERSAL", "file resolves outside pack root", relpath)
+                    continue
 
-        raw = fpath.read_bytes()
-        got = _sha256_hex(raw)
-        if got != sha:
-            issues.append(
-                ValidationIssue(
-                    "SHA256_MISMATCH",
-                    "sha256 pin mismatch for raw bytes",
-                    relpath,
-                )
-            )
+                if kind != _KIND_FILE:
+                    yield ValidationIssue("FILE_MISSING", "pinned file missing", relpath)
+                    continue
+
+                with open(resolver.path_of(norm), "rb") as fh:
+                    raw = fh.read()
+                got = _sha256_hex(raw)
+                if got != sha:
+                    yield ValidationIssue(
+                        "SHA256_MISMATCH",
+                        "sha256 pin mismatch for raw bytes",
+                        relpath,
+                    )
+            if n == 0:
+                yield ValidationIssue("FILES", "files must be a non-empty object mapping relpath -> sha256", "files")
+            else:
+                files_ok = True
+
+    yield from check_headers()
+    # Required fields that never appeared
+    for key in _HEADER_KEYS:
+        if key not in seen:
+            yield from _check_header(key, None)
+
+    if not files_seen:
+        yield ValidationIssue("FILES", "files must be a non-empty object mapping relpath -> sha256", "files")
+    if not files_ok:
+        return
+
+    # Files present in the tree but not pinned by the manifest (opt-in).
+    # The tree is only walked here, after every pin has been checked.
+    if check_unpinned:
+        for rel, entry in _iter_tree(root, tree_ignore):
+            if rel == _MANIFEST_NAME or rel in pinned:
+                continue
+            if entry.kind == _KIND_ESCAPE:
+                yield ValidationIssue("SYMLINK_ESCAPE", "symlink resolves outside pack root", rel)
+            else:
+                yield ValidationIssue("UNPINNED_FILE", "file present in pack but not pinned in files", rel)
 
     # Entrypoints
-    entrypoints = manifest.get("entrypoints")
     if entrypoints is not None:
         if not isinstance(entrypoints, dict):
-            issues.append(ValidationIssue("ENTRYPOINTS_TYPE", "entrypoints must be an object", "entrypoints"))
+            yield ValidationIssue("ENTRYPOINTS_TYPE", "entrypoints must be an object", "entrypoints")
         else:
             for name, rel in entrypoints.items():
                 if not isinstance(name, str) or not name:
-                    issues.append(ValidationIssue("ENTRYPOINT_NAME", "entrypoint name must be a non-empty string", "entrypoints"))
+                    yield ValidationIssue("ENTRYPOINT_NAME", "entrypoint name must be a non-empty string", "entrypoints")
                     continue
                 if not isinstance(rel, str) or not _is_safe_relpath(rel):
-                    issues.append(ValidationIssue("ENTRYPOINT_PATH", "entrypoint relpath must be a safe relative path", f"entrypoints.{name}"))
+                    yield ValidationIssue("ENTRYPOINT_PATH", "entrypoint relpath must be a safe relative path", f"entrypoints.{name}")
                     continue
-                if rel not in files:
-                    issues.append(ValidationIssue("ENTRYPOINT_NOT_PINNED", "entrypoint must reference a pinned file in files", f"entrypoints.{name}"))
+                # Matched on the raw spelling, as in v2.0.1: "./a.json" does not
+                # reference a file pinned as "a.json"
+                norm = _normalize_relpath(rel)
+                if norm not in pinned or aliases.get(norm, norm) != rel:
+                    yield ValidationIssue("ENTRYPOINT_NOT_PINNED", "entrypoint must reference a pinned file in files", f"entrypoints.{name}")
+
+
+def _iter_stream_issues(
+    root: Path,
+    check_unpinned: bool,
+    tree_ignore: Iterable[str],
+) -> Iterator[ValidationIssue]:
+    try:
+        mf = _manifest_path(root)
+    except FileNotFoundError as e:
+        yield ValidationIssue("MANIFEST_READ_ERROR", str(e), _MANIFEST_NAME)
+        return
+    try:
+        yield from _iter_manifest_issues(root, _stream_manifest(mf), check_unpinned, tree_ignore)
+    except _ManifestReadError as e:
+        # Malformed JSON is detected where it occurs; earlier issues stand.
+        yield ValidationIssue("MANIFEST_READ_ERROR", str(e), _MANIFEST_NAME)
+
 
-    return ValidationReport(ok=(len(issues) == 0), issues=tuple(issues))
+def _limit_issues(
+    issues: Iterator[ValidationIssue],
+    limit: int | None,
+) -> Iterator[ValidationIssue]:
+    try:
+        for n, issue in enumerate(issues, 1):
+            yield issue
+            if limit is not None and n >= limit:
+                return
+    finally:
+        # Release the manifest file handle promptly on early exit
+        close = getattr(issues, "close", None)
+        if close is not None:
+            close()
+
+
+def iter_validation_issues(
+    pack_root: str | Path,
+    *,
+    max_issues: int | None = None,
+    fail_fast: bool = False,
+    check_unpinned: bool = False,
+    tree_ignore: Iterable[str] = DEFAULT_TREE_IGNORE,
+) -> Iterator[ValidationIssue]:
+    """Yield ValidationIssues as they are found, streaming the manifest.
+
+    The manifest is read incrementally and `files` entries are checked one at
+    a time, so the first failure is available without parsing the whole
+    document. Stops after max_issues issues (fail_fast=True means 1).
+
+    check_unpinned additionally reports UNPINNED_FILE / SYMLINK_ESCAPE for tree
+    entries not pinned in files; names matching tree_ignore are skipped.
+    Raises ValueError immediately if max_issues is not positive.
+    """
+    limit = 1 if fail_fast else max_issues
+    if limit is not None and limit <= 0:
+        raise ValueError("max_issues must be positive")
+    root = Path(pack_root).expanduser().resolve()
+    return _limit_issues(_iter_stream_issues(root, check_unpinned, tree_ignore), limit)
+
+
+def validate_pack(
+    pack_root: str | Path,
+    *,
+    max_issues: int | None = None,
+    check_unpinned: bool = False,
+    tree_ignore: Iterable[str] = DEFAULT_TREE_IGNORE,
+) -> ValidationReport:
+    issues = tuple(
+        iter_validation_issues(
+            pack_root,
+            max_issues=max_issues,
+            check_unpinned=check_unpinned,
+            tree_ignore=tree_ignore,
+        )
+    )
+    return ValidationReport(ok=(len(issues) == 0), issues=issues)
 
 
 @dataclass(frozen=True)
@@ -252,13 +761,23 @@ class PackHandle:
         return json.loads(self.read_text(relpath, encoding="utf-8"))
 
 
-def load_pack(pack_root: str | Path) -> PackHandle:
+def load_pack(
+    pack_root: str | Path,
+    *,
+    check_unpinned: bool = False,
+    tree_ignore: Iterable[str] = DEFAULT_TREE_IGNORE,
+) -> PackHandle:
     root = Path(pack_root).expanduser().resolve()
-    report = validate_pack(root)
-    if not report.ok:
+    try:
+        manifest = _load_manifest(root)
+    except Exception as e:
+        issues: tuple[ValidationIssue, ...] = (ValidationIssue("MANIFEST_READ_ERROR", str(e), _MANIFEST_NAME),)
+    else:
+        # Validate the already-parsed manifest; it is read from disk only once
+        issues = tuple(_iter_manifest_issues(root, iter(manifest.items()), check_unpinned, tree_ignore))
+    if issues:
         # Deterministic error message ordering
-        msg = "; ".join(f"{i.code}:{i.path or ''}" for i in report.issues)
+        msg = "; ".join(f"{i.code}:{i.path or ''}" for i in issues)
         raise PackValidationError(f"Pack validation failed: {msg}")
 
-    manifest = _load_manifest(root)
     return PackHandle(root=root, manifest=manifest)
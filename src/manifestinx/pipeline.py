@@ -0,0 +1,291 @@
+"""Memoizing DAG executor for pack-defined deterministic transforms.
+
+A pack declares a stage graph in a pinned JSON file referenced by an
+entrypoint. Core does not ship or load transform code: callers supply a
+registry mapping transform names to callables. Stage graph layout:
+
+    {
+      "schema_version": "pipeline_v0.1",
+      "stages": [
+        {"id": "a", "transform": "lower", "inputs": ["$input"]},
+        {"id": "b", "transform": "count", "inputs": ["a"], "config": "cfg/b.json"}
+      ],
+      "output": "b"
+    }
+
+- "$input" refers to the batch item itself.
+- "config" (optional) must be a pinned file; it is parsed as JSON and passed
+  to the transform.
+- Any other keys on a stage (e.g. "version") are part of its pin.
+
+Each stage has a pin sha256 derived from its canonical definition plus the
+manifest sha256 of its config file. Stage outputs are memoized keyed by
+(stage pin sha256, input digest), so re-running a batch only recomputes
+stages whose inputs or pins changed. The default cache is an LRU bounded to
+DEFAULT_CACHE_SIZE entries; any MutableMapping may be passed instead.
+
+Transform code comes from the caller's registry and is not part of the pin.
+To reuse a cache across transform changes, pass transform_versions (name ->
+version string) and bump a version whenever its implementation changes; the
+version is mixed into the pin. Without it, clear the cache when any
+transform changes, or stale outputs are returned.
+
+Each stage is scheduled as soon as all of its inputs are complete, so
+independent branches run concurrently and a short branch never waits for an
+unrelated long one.
+
+Transforms must be deterministic and return JSON-serializable values.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Mapping, MutableMapping, Optional, Sequence
+
+from .pack_system import PackHandle, _is_safe_relpath
+
+PIPELINE_SCHEMA_VERSION = "pipeline_v0.1"
+INPUT_REF = "$input"
+DEFAULT_CACHE_SIZE = 65536
+
+Transform = Callable[[Sequence[Any], Any], Any]
+
+
+class PipelineError(RuntimeError):
+    """Raised when a stage graph is malformed or cannot be executed."""
+
+
+def _canonical_json_bytes(obj: Any) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _digest(obj: Any) -> str:
+    try:
+        return hashlib.sha256(_canonical_json_bytes(obj)).hexdigest()
+    except (TypeError, ValueError) as e:
+        raise PipelineError(f"value is not JSON-serializable: {e}") from e
+
+
+class LRUCache(MutableMapping[Any, Any]):
+    """Thread-safe mapping that evicts the least recently used entry past maxsize."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    id: str
+    transform: str
+    inputs: tuple[str, ...]
+    pin_sha256: str
+    config: Any = None
+
+
+class Pipeline:
+    """Executes a validated stage graph over batches, memoizing stage outputs."""
+
+    def __init__(
+        self,
+        stages: Sequence[PipelineStage],
+        output: str,
+        transforms: Mapping[str, Transform],
+        *,
+        cache: Optional[MutableMapping[tuple[str, str], tuple[Any, str]]] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.stages = {s.id: s for s in stages}
+        if len(self.stages) != len(stages):
+            raise PipelineError("duplicate stage id")
+        if output not in self.stages:
+            raise PipelineError(f"unknown output stage: {output}")
+        for s in stages:
+            if s.transform not in transforms:
+                raise PipelineError(f"unknown transform for stage {s.id}: {s.transform}")
+        self.output = output
+        self.transforms = transforms
+        self._check_graph()
+        self.cache: MutableMapping[tuple[str, str], tuple[Any, str]] = LRUCache() if cache is None else cache
+        self.max_workers = max_workers
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def _check_graph(self) -> None:
+        """Reject unknown inputs and cycles (run() would otherwise stall)."""
+        indegree: dict[str, int] = {}
+        children: dict[str, list[str]] = {sid: [] for sid in self.stages}
+        for sid, s in self.stages.items():
+            deps = [d for d in s.inputs if d != INPUT_REF]
+            for d in deps:
+                if d not in self.stages:
+                    raise PipelineError(f"stage {sid} references unknown input: {d}")
+                children[d].append(sid)
+            indegree[sid] = len(deps)
+
+        ready = [sid for sid, n in indegree.items() if n == 0]
+        seen = 0
+        while ready:
+            sid = ready.pop()
+            seen += 1
+            for c in children[sid]:
+                indegree[c] -= 1
+                if indegree[c] == 0:
+                    ready.append(c)
+        if seen != len(self.stages):
+            raise PipelineError("stage graph contains a cycle")
+
+    def _run_stage(
+        self,
+        stage: PipelineStage,
+        columns: Sequence[Sequence[tuple[Any, str]]],
+    ) -> list[tuple[Any, str]]:
+        """Run one stage over the batch; columns holds each input's (value, digest) list."""
+        fn = self.transforms[stage.transform]
+        out: list[tuple[Any, str]] = []
+        hits = misses = 0
+        for args in zip(*columns):
+            key = (stage.pin_sha256, _digest([d for _, d in args]))
+            hit = self.cache.get(key)
+            if hit is None:
+                result = fn(tuple(v for v, _ in args), stage.config)
+                hit = (result, _digest(result))
+                self.cache[key] = hit
+                misses += 1
+            else:
+                hits += 1
+            out.append(hit)
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+        return out
+
+    def run(self, batch: Iterable[Any]) -> list[Any]:
+        """Run the graph over each batch item and return the output stage values."""
+        columns: dict[str, list[tuple[Any, str]]] = {
+            INPUT_REF: [(item, _digest(item)) for item in batch],
+        }
+        if not columns[INPUT_REF]:
+            return []
+
+        pending = {sid: {d for d in s.inputs if d != INPUT_REF} for sid, s in self.stages.items()}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running: dict[Future[list[tuple[Any, str]]], str] = {}
+
+            def submit_ready() -> None:
+                for sid in sorted(sid for sid, deps in pending.items() if not deps):
+                    del pending[sid]
+                    stage = self.stages[sid]
+                    inputs = [columns[ref] for ref in stage.inputs]
+                    running[pool.submit(self._run_stage, stage, inputs)] = sid
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    sid = running.pop(fut)
+                    columns[sid] = fut.result()
+                    for deps in pending.values():
+                        deps.discard(sid)
+                submit_ready()
+
+        return [v for v, _ in columns[self.output]]
+
+
+def load_pipeline(
+    handle: PackHandle,
+    entrypoint: str,
+    transforms: Mapping[str, Transform],
+    *,
+    cache: Optional[MutableMapping[tuple[str, str], tuple[Any, str]]] = None,
+    max_workers: Optional[int] = None,
+    transform_versions: Optional[Mapping[str, str]] = None,
+) -> Pipeline:
+    """Build a Pipeline from the stage graph at a pack entrypoint.
+
+    transform_versions, if given, maps transform names to version strings
+    that are mixed into each stage pin.
+    """
+    rel = (handle.manifest.get("entrypoints") or {}).get(entrypoint)
+    if rel is None:
+        raise KeyError(f"Unknown entrypoint: {entrypoint}")
+    graph = handle.read_json(rel)
+    if not isinstance(graph, dict):
+        raise PipelineError("stage graph must be a JSON object")
+    if graph.get("schema_version") != PIPELINE_SCHEMA_VERSION:
+        raise PipelineError(f"schema_version must equal '{PIPELINE_SCHEMA_VERSION}'")
+
+    raw_stages = graph.get("stages")
+    if not isinstance(raw_stages, list) or not raw_stages:
+        raise PipelineError("stages must be a non-empty array")
+    output = graph.get("output")
+    if not isinstance(output, str):
+        raise PipelineError("output must be a stage id")
+
+    files = handle.manifest.get("files") or {}
+    stages: list[PipelineStage] = []
+    for raw in raw_stages:
+        if not isinstance(raw, dict):
+            raise PipelineError("stage must be an object")
+        sid = raw.get("id")
+        transform = raw.get("transform")
+        inputs = raw.get("inputs")
+        if not isinstance(sid, str) or not sid or sid == INPUT_REF:
+            raise PipelineError("stage id must be a non-empty string")
+        if not isinstance(transform, str) or not transform:
+            raise PipelineError(f"stage {sid}: transform must be a non-empty string")
+        if not isinstance(inputs, list) or not inputs or not all(isinstance(i, str) for i in inputs):
+            raise PipelineError(f"stage {sid}: inputs must be a non-empty array of strings")
+
+        config = None
+        config_sha = None
+        config_rel = raw.get("config")
+        if config_rel is not None:
+            if not isinstance(config_rel, str) or not _is_safe_relpath(config_rel):
+                raise PipelineError(f"stage {sid}: config must be a safe relative path")
+            config_sha = files.get(config_rel)
+            if config_sha is None:
+                raise PipelineError(f"stage {sid}: config must reference a pinned file in files")
+            config = handle.read_json(config_rel)
+
+        pin_src: dict[str, Any] = {"stage": raw, "config_sha256": config_sha}
+        version = (transform_versions or {}).get(transform)
+        if version is not None:
+            pin_src["transform_version"] = version
+        pin = _digest(pin_src)
+        stages.append(PipelineStage(sid, transform, tuple(inputs), pin, config))
+
+    return Pipeline(stages, output, transforms, cache=cache, max_workers=max_workers)
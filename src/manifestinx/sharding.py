@@ -0,0 +1,257 @@
+"""Deterministic digest-based sharding for multi-node ingest.
+
+Routing is a pure function of an input's sha256 digest and the shard set, so
+identical inputs always land on the same node and per-node caches / dedup
+stores stay effective. Digests are taken as given (hex str or raw bytes);
+the router never re-hashes inputs. Use Engine.input_digest() or the lean
+result field "input_digest" as the routing key. Both are taken after
+canonicalization, so equivalent drafts route together. Do not route on
+"input_sha256": it is the digest of the raw input.
+
+Strategies:
+- ConsistentHashRing: virtual-node ring; arbitrary add/remove moves ~1/N keys.
+- JumpHash: Lamping & Veach jump consistent hash; no ring state, but shards
+  may only be added or removed at the end of the node list.
+
+LocalCluster is a multi-process stand-in for a fleet, intended for testing
+rebalancing when shards are added or removed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import multiprocessing
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+Digest = str | bytes
+
+
+def digest_key(digest: Digest) -> int:
+    """Map a sha256 digest (hex or raw) to a 64-bit routing key."""
+    if isinstance(digest, str):
+        if len(digest) < 16:
+            raise ValueError("digest must be sha256 hex or raw bytes")
+        return int(digest[:16], 16)
+    if len(digest) < 8:
+        raise ValueError("digest must be sha256 hex or raw bytes")
+    return int.from_bytes(digest[:8], "big", signed=False)
+
+
+def jump_hash(key: int, num_buckets: int) -> int:
+    """Jump consistent hash (Lamping & Veach, 2014) of a 64-bit key."""
+    if num_buckets <= 0:
+        raise ValueError("num_buckets must be positive")
+    b, j = -1, 0
+    key &= 0xFFFFFFFFFFFFFFFF
+    while j < num_buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+
+class ConsistentHashRing:
+    """Consistent-hash ring with virtual nodes."""
+
+    def __init__(self, nodes: Iterable[str] = (), *, replicas: int = 64) -> None:
+        if replicas <= 0:
+            raise ValueError("replicas must be positive")
+        self.replicas = replicas
+        self._points: list[int] = []
+        self._owners: list[str] = []
+        self._nodes: set[str] = set()
+        for n in nodes:
+            self.add_node(n)
+
+    @property
+    def nodes(self) -> tuple[str, ...]:
+        return tuple(sorted(self._nodes))
+
+    def _vnode_points(self, node: str) -> Iterator[int]:
+        for i in range(self.replicas):
+            yield digest_key(hashlib.sha256(f"{node}#{i}".encode("utf-8")).digest())
+
+    def add_node(self, node: str) -> None:
+        if node in self._nodes:
+            raise ValueError(f"node already present: {node}")
+        self._nodes.add(node)
+        for p in self._vnode_points(node):
+            i = bisect.bisect_left(self._points, p)
+            # Tie-break equal points by node name so the ring is order-independent
+            while i < len(self._points) and self._points[i] == p and self._owners[i] < node:
+                i += 1
+            self._points.insert(i, p)
+            self._owners.insert(i, node)
+
+    def remove_node(self, node: str) -> None:
+        if node not in self._nodes:
+            raise KeyError(f"unknown node: {node}")
+        self._nodes.discard(node)
+        keep = [(p, o) for p, o in zip(self._points, self._owners) if o != node]
+        self._points = [p for p, _ in keep]
+        self._owners = [o for _, o in keep]
+
+    def node_for(self, digest: Digest) -> str:
+        if not self._points:
+            raise LookupError("ring has no nodes")
+        i = bisect.bisect_right(self._points, digest_key(digest))
+        return self._owners[i % len(self._owners)]
+
+
+class JumpHash:
+    """Jump-hash routing over an ordered node list."""
+
+    def __init__(self, nodes: Iterable[str] = ()) -> None:
+        self._nodes: list[str] = []
+        for n in nodes:
+            self.add_node(n)
+
+    @property
+    def nodes(self) -> tuple[str, ...]:
+        return tuple(self._nodes)
+
+    def add_node(self, node: str) -> None:
+        if node in self._nodes:
+            raise ValueError(f"node already present: {node}")
+        self._nodes.append(node)
+
+    def remove_node(self, node: str) -> None:
+        if not self._nodes or self._nodes[-1] != node:
+            raise ValueError("jump hash can only remove the last node")
+        self._nodes.pop()
+
+    def node_for(self, digest: Digest) -> str:
+        if not self._nodes:
+            raise LookupError("no nodes")
+        return self._nodes[jump_hash(digest_key(digest), len(self._nodes))]
+
+
+Strategy = ConsistentHashRing | JumpHash
+
+
+class ShardRouter:
+    """Splits batches or streams into per-shard sub-streams by digest."""
+
+    def __init__(self, strategy: Strategy, key: Optional[Callable[[Any], Digest]] = None) -> None:
+        self.strategy = strategy
+        # Extracts the precomputed digest from an item (default: item is the digest)
+        self.key: Callable[[Any], Digest] = key if key is not None else (lambda x: x)
+
+    def route(self, items: Iterable[T]) -> Iterator[tuple[str, T]]:
+        """Lazily tag each item with its shard, preserving input order."""
+        node_for = self.strategy.node_for
+        key = self.key
+        for item in items:
+            yield node_for(key(item)), item
+
+    def partition(self, items: Iterable[T]) -> dict[str, list[T]]:
+        """Split a batch into per-shard lists (every current shard present)."""
+        out: dict[str, list[T]] = {n: [] for n in self.strategy.nodes}
+        for node, item in self.route(items):
+            out[node].append(item)
+        return out
+
+    def dispatch(self, items: Iterable[T], sinks: Mapping[str, Callable[[T], Any]]) -> int:
+        """Push each item of a stream to its shard's sink; returns the count."""
+        n = 0
+        for node, item in self.route(items):
+            sinks[node](item)
+            n += 1
+        return n
+
+
+def _node_main(conn: Any) -> None:
+    """Stand-in node: keeps a digest store and answers simple commands."""
+    store: set[str] = set()
+    while True:
+        op, arg = conn.recv()
+        if op == "put":
+            store.update(arg)
+        elif op == "drop":
+            store.difference_update(arg)
+        elif op == "dump":
+            conn.send(sorted(store))
+        elif op == "stop":
+            conn.close()
+            return
+
+
+class LocalCluster:
+    """Multi-process stand-in cluster; each node process holds a dedup store.
+
+    Keys are routed with the given strategy. add_node/remove_node migrate the
+    keys whose owner changed and return how many moved.
+    """
+
+    def __init__(self, strategy: Strategy) -> None:
+        self.router = ShardRouter(strategy)
+        self._ctx = multiprocessing.get_context()
+        self._procs: dict[str, Any] = {}
+        self._conns: dict[str, Any] = {}
+        for n in strategy.nodes:
+            self._start(n)
+
+    def _start(self, node: str) -> None:
+        parent, child = self._ctx.Pipe()
+        proc = self._ctx.Process(target=_node_main, args=(child,), daemon=True)
+        proc.start()
+        child.close()
+        self._procs[node] = proc
+        self._conns[node] = parent
+
+    def _stop(self, node: str) -> None:
+        self._conns[node].send(("stop", None))
+        self._procs[node].join()
+        self._conns.pop(node).close()
+        self._procs.pop(node)
+
+    def submit(self, digests: Iterable[str]) -> None:
+        for node, batch in self.router.partition(digests).items():
+            if batch:
+                self._conns[node].send(("put", batch))
+
+    def snapshot(self) -> dict[str, list[str]]:
+        out: dict[str, list[str]] = {}
+        for node, conn in sorted(self._conns.items()):
+            conn.send(("dump", None))
+            out[node] = conn.recv()
+        return out
+
+    def _rebalance(self, before: Mapping[str, Sequence[str]]) -> int:
+        moved = 0
+        for src, digests in before.items():
+            moving = self.router.partition(digests)
+            for dst, batch in moving.items():
+                if dst == src or not batch:
+                    continue
+                self._conns[dst].send(("put", batch))
+                if src in self._conns:
+                    self._conns[src].send(("drop", batch))
+                moved += len(batch)
+        return moved
+
+    def add_node(self, node: str) -> int:
+        before = self.snapshot()
+        self.router.strategy.add_node(node)
+        self._start(node)
+        return self._rebalance(before)
+
+    def remove_node(self, node: str) -> int:
+        before = self.snapshot()
+        self.router.strategy.remove_node(node)
+        moved = self._rebalance({node: before[node]})
+        self._stop(node)
+        return moved
+
+    def close(self) -> None:
+        for node in list(self._conns):
+            self._stop(node)
+
+    def __enter__(self) -> "LocalCluster":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
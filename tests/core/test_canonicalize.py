@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+
+from manifestinx import canonicalize
+from manifestinx.canonicalize import CANONICALIZATION_VERSION, canonicalize_batch, canonicalize_text
+from manifestinx.engine import Engine
+
+
+class TestCanonicalize(unittest.TestCase):
+    def test_ascii_fast_path_returns_same_object(self) -> None:
+        text = "already canonical\nsecond line"
+        self.assertIs(canonicalize_text(text), text)
+
+    def test_newlines_whitespace_and_nfc(self) -> None:
+        nfd = "Cafe\u0301 \r\nline two\t\rend  "
+        self.assertEqual(canonicalize_text(nfd), "Caf\u00e9\nline two\nend")
+
+    def test_batch_matches_single(self) -> None:
+        texts = ["a\r\nb", "plain", "e\u0301  \n"]
+        self.assertEqual(list(canonicalize_batch(texts)), [canonicalize_text(t) for t in texts])
+
+    def test_unknown_version_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            canonicalize_text("x", "text_canon_v999")
+
+    def test_dispatches_on_version(self) -> None:
+        with mock.patch.dict(canonicalize._RULES, {"text_canon_test": str.upper}):
+            self.assertEqual(canonicalize_text("ab", "text_canon_test"), "AB")
+            self.assertEqual(list(canonicalize_batch(["a", "b"], "text_canon_test")), ["A", "B"])
+
+            out = Engine().run_text("ab", canonicalize="text_canon_test")
+            self.assertEqual(out["canonicalization"], "text_canon_test")
+            self.assertEqual(out["feature_vector"], Engine().run_text("AB")["feature_vector"])
+
+    def test_engine_canonicalize_is_opt_in_and_recorded(self) -> None:
+        e = Engine()
+        a = e.run_text("Cafe\u0301\r\n", canonicalize=True)
+        b = e.run_text("Caf\u00e9\n", canonicalize=True)
+
+        self.assertEqual(a["feature_vector"], b["feature_vector"])
+        self.assertEqual(a["canonicalization"], CANONICALIZATION_VERSION)
+        self.assertEqual(a["input_text"], "Cafe\u0301\r\n")
+
+        raw = e.run_text("Cafe\u0301\r\n")
+        self.assertNotIn("canonicalization", raw)
+        self.assertNotEqual(raw["feature_vector"], a["feature_vector"])
+
+    def test_engine_run_batch_matches_run_text(self) -> None:
+        e = Engine()
+        texts = ["one", "two\r\n", "thre\u0301e"]
+        self.assertEqual(
+            list(e.run_batch(texts, canonicalize=True)),
+            [e.run_text(t, canonicalize=True) for t in texts],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
 # tests/core/test_engine_core.py
+import hashlib
+import io
+import json
 import unittest
 
 from manifestinx.engine import Engine, FEATURE_DIMS
@@ -31,3 +34,27 @@ class TestEngineCore(unittest.TestCase):
         # Core MUST NOT ship or imply template catalogs
         self.assertNotIn("template_id", out)
         self.assertNotIn("mapped_vectors", out)
+
+    def test_lean_mode_drops_input_echo(self) -> None:
+        e = Engine()
+        text = "héllo " * 1000
+        full = e.run_text(text)
+        lean = e.run_text(text, lean=True)
+
+        self.assertNotIn("input_text", lean)
+        raw = text.encode("utf-8")
+        self.assertEqual(lean["input_sha256"], hashlib.sha256(raw).hexdigest())
+        self.assertEqual(lean["input_bytes"], len(raw))
+        self.assertEqual(lean["feature_vector"], full["feature_vector"])
+
+    def test_write_batch_matches_to_dict(self) -> None:
+        e = Engine()
+        texts = ["a", "b\r\n", "ünïcode"]
+        for kwargs in ({}, {"lean": True}, {"lean": True, "diagnostics": True, "canonicalize": True}):
+            buf = io.StringIO()
+            n = e.write_batch(texts, buf, **kwargs)
+            self.assertEqual(n, len(texts))
+            lines = [json.loads(ln) for ln in buf.getvalue().splitlines()]
+            self.assertEqual(lines, list(e.run_batch(texts, **kwargs)))
+            # Same lean default as run_text / run_batch
+            self.assertEqual("input_text" in lines[0], not kwargs.get("lean", False))
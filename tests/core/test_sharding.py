@@ -0,0 +1,66 @@
+import hashlib
+import unittest
+
+from manifestinx.engine import Engine
+from manifestinx.sharding import ConsistentHashRing, JumpHash, LocalCluster, ShardRouter, jump_hash
+
+
+def _digests(n: int) -> list[str]:
+    return [hashlib.sha256(str(i).encode("utf-8")).hexdigest() for i in range(n)]
+
+
+class TestSharding(unittest.TestCase):
+    def test_jump_hash_reference_values(self) -> None:
+        vectors = [(1, 1, 0), (42, 57, 43), (0xDEAD10CC, 1, 0), (0xDEAD10CC, 666, 361), (256, 1024, 520)]
+        for key, buckets, want in vectors:
+            self.assertEqual(jump_hash(key, buckets), want)
+
+    def test_routing_is_deterministic_and_order_independent(self) -> None:
+        digests = _digests(200)
+        a = ShardRouter(ConsistentHashRing(["n1", "n2", "n3"])).partition(digests)
+        b = ShardRouter(ConsistentHashRing(["n3", "n1", "n2"])).partition(digests)
+        self.assertEqual(a, b)
+        self.assertTrue(all(a.values()))
+
+    def test_router_uses_precomputed_digest(self) -> None:
+        e = Engine()
+        router = ShardRouter(JumpHash(["a", "b", "c", "d"]), key=lambda r: r["input_digest"])
+
+        results = list(e.run_batch(["x", "y", "x"], lean=True))
+        routed = [node for node, _ in router.route(results)]
+        self.assertEqual(routed[0], routed[2])
+        self.assertEqual(routed[0], router.strategy.node_for(e.input_digest("x")))
+
+        # Canonically equivalent drafts share a routing key
+        texts = ["Caf\u00e9\r\n", "Cafe\u0301\n"]
+        canon = list(e.run_batch(texts, lean=True, canonicalize=True))
+        self.assertEqual(canon[0]["input_digest"], canon[1]["input_digest"])
+        self.assertNotEqual(canon[0]["input_sha256"], canon[1]["input_sha256"])
+        self.assertEqual(canon[0]["input_digest"], e.input_digest(texts[1], canonicalize=True))
+        self.assertEqual(len({node for node, _ in router.route(canon)}), 1)
+
+    def test_jump_hash_only_removes_last_node(self) -> None:
+        jh = JumpHash(["a", "b", "c"])
+        with self.assertRaises(ValueError):
+            jh.remove_node("a")
+        jh.remove_node("c")
+        self.assertEqual(jh.nodes, ("a", "b"))
+
+    def test_local_cluster_rebalance_moves_minimal_keys(self) -> None:
+        digests = _digests(400)
+        with LocalCluster(ConsistentHashRing(["n1", "n2", "n3"])) as cluster:
+            cluster.submit(digests)
+            moved = cluster.add_node("n4")
+            snap = cluster.snapshot()
+
+            self.assertEqual(sorted(d for ds in snap.values() for d in ds), sorted(digests))
+            self.assertEqual(len(snap["n4"]), moved)
+            self.assertLess(moved, len(digests) // 2)
+
+            moved_back = cluster.remove_node("n4")
+            self.assertEqual(moved_back, moved)
+            self.assertEqual(sorted(d for ds in cluster.snapshot().values() for d in ds), sorted(digests))
+
+
+if __name__ == "__main__":
+    unittest.main()
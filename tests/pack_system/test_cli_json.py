@@ -1,7 +1,7 @@
 import io
 import json
 import unittest
-from contextlib import redirect_stdout
+from contextlib import redirect_stderr, redirect_stdout
 
 from manifestinx.cli import main
 
@@ -34,3 +34,15 @@ class TestCliJson(unittest.TestCase):
         self.assertIn("issues", payload)
         self.assertIsInstance(payload["issues"], list)
         self.assertGreaterEqual(len(payload["issues"]), 1)
+
+    def test_pack_validate_limit_flags(self) -> None:
+        for argv in (["--max-issues", "0"], ["--max-issues", "-1"], ["--max-issues", "1", "--fail-fast"]):
+            with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+                main(["pack", "validate", "tests/fixtures/test_pack", *argv])
+            self.assertEqual(cm.exception.code, 2)
+
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            code = main(["pack", "validate", "tests", "--json", "--fail-fast"])
+        self.assertNotEqual(code, 0)
+        self.assertEqual(len(json.loads(buf.getvalue())["issues"]), 1)
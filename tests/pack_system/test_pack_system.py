@@ -1,9 +1,13 @@
+import hashlib
+import json
+import os
 import shutil
 import tempfile
 import unittest
+from unittest import mock
 from pathlib import Path
 
-from manifestinx.pack_system import load_pack, validate_pack
+from manifestinx.pack_system import PackValidationError, iter_validation_issues, load_pack, validate_pack
 
 
 FIXTURE = Path(__file__).resolve().parents[1] / "fixtures" / "test_pack"
@@ -39,6 +43,192 @@ class TestPackSystem(unittest.TestCase):
             codes = {iss.code for iss in report.issues}
             self.assertIn("SHA256_MISMATCH", codes)
 
+    def test_unpinned_file_reported(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td) / "pack"
+            shutil.copytree(FIXTURE, tmp)
+            (tmp / "extra").mkdir()
+            (tmp / "extra" / "notes.txt").write_text("x", encoding="utf-8")
+
+            # Opt-in: default validation (and load_pack) is unchanged
+            self.assertTrue(validate_pack(tmp).ok)
+            load_pack(tmp)
+
+            report = validate_pack(tmp, check_unpinned=True)
+            self.assertFalse(report.ok)
+            found = [(iss.code, iss.path) for iss in report.issues]
+            self.assertEqual(found, [("UNPINNED_FILE", "extra/notes.txt")])
+
+    def test_unpinned_check_skips_ignored_names(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td) / "pack"
+            shutil.copytree(FIXTURE, tmp)
+            (tmp / ".git").mkdir()
+            (tmp / ".git" / "HEAD").write_text("ref", encoding="utf-8")
+            (tmp / ".DS_Store").write_bytes(b"x")
+
+            self.assertTrue(validate_pack(tmp, check_unpinned=True).ok)
+            report = validate_pack(tmp, check_unpinned=True, tree_ignore=())
+            found = sorted(iss.path for iss in report.issues)
+            self.assertEqual(found, [".DS_Store", ".git/HEAD"])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks unsupported")
+    def test_symlink_escape_reported(self):
+        with tempfile.TemporaryDirectory() as td:
+            outside = Path(td) / "outside.txt"
+            outside.write_text("secret", encoding="utf-8")
+            tmp = Path(td) / "pack"
+            shutil.copytree(FIXTURE, tmp)
+            try:
+                os.symlink(outside, tmp / "link.txt")
+            except OSError:
+                self.skipTest("cannot create symlink")
+
+            report = validate_pack(tmp, check_unpinned=True)
+            found = [(iss.code, iss.path) for iss in report.issues]
+            self.assertEqual(found, [("SYMLINK_ESCAPE", "link.txt")])
+
+    def _pack_with_dir_link(self, td: str, inside: bool) -> Path:
+        tmp = Path(td) / "pack"
+        shutil.copytree(FIXTURE, tmp)
+        target = tmp / "real" if inside else Path(td) / "outside"
+        target.mkdir()
+        (target / "f.json").write_text("{}", encoding="utf-8")
+        try:
+            os.symlink(target, tmp / "ext", target_is_directory=True)
+        except OSError:
+            self.skipTest("cannot create symlink")
+
+        mf = tmp / "pack_manifest.json"
+        manifest = json.loads(mf.read_text("utf-8"))
+        pin = hashlib.sha256(b"{}").hexdigest()
+        manifest["files"]["ext/f.json"] = pin
+        if inside:
+            manifest["files"]["real/f.json"] = pin
+        mf.write_text(json.dumps(manifest), encoding="utf-8")
+        return tmp
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks unsupported")
+    def test_pin_through_escaping_dir_link_is_traversal(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = self._pack_with_dir_link(td, inside=False)
+
+            found = [(iss.code, iss.path) for iss in validate_pack(tmp).issues]
+            self.assertEqual(found, [("PATH_TRAVERSAL", "ext/f.json")])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks unsupported")
+    def test_pin_through_in_root_dir_link(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = self._pack_with_dir_link(td, inside=True)
+
+            self.assertEqual(validate_pack(tmp, check_unpinned=True).issues, ())
+
+    def test_entrypoint_matches_raw_pin_spelling(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td) / "pack"
+            shutil.copytree(FIXTURE, tmp)
+            mf = tmp / "pack_manifest.json"
+            manifest = json.loads(mf.read_text("utf-8"))
+            manifest["entrypoints"]["payload"] = "./payload.json"
+            mf.write_text(json.dumps(manifest), encoding="utf-8")
+
+            found = [(iss.code, iss.path) for iss in validate_pack(tmp).issues]
+            self.assertEqual(found, [("ENTRYPOINT_NOT_PINNED", "entrypoints.payload")])
+
+            # A pin spelled "./payload.json" is referenced by that spelling only
+            manifest["files"] = {"./payload.json": manifest["files"]["payload.json"]}
+            mf.write_text(json.dumps(manifest), encoding="utf-8")
+            self.assertTrue(validate_pack(tmp).ok)
+
+    def test_iter_issues_early_exit(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td) / "pack"
+            tmp.mkdir()
+            files = {f"missing_{i}.json": "0" * 64 for i in range(50)}
+            manifest = {"files": files, "schema_version": "pack_manifest_v0.1", "pack_id": "big"}
+            (tmp / "pack_manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+            # Early exit never reaches the (opt-in) tree walk
+            with mock.patch("manifestinx.pack_system._iter_tree", side_effect=AssertionError):
+                first = list(iter_validation_issues(tmp, fail_fast=True, check_unpinned=True))
+            self.assertEqual([(i.code, i.path) for i in first], [("FILE_MISSING", "missing_0.json")])
+            self.assertEqual(len(list(iter_validation_issues(tmp, max_issues=5))), 5)
+            with self.assertRaises(ValueError):
+                iter_validation_issues(tmp, max_issues=0)
+            self.assertEqual(len(validate_pack(tmp).issues), 50)
+
+    def test_streamed_manifest_matches_loaded(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td) / "pack"
+            shutil.copytree(FIXTURE, tmp)
+            mf = tmp / "pack_manifest.json"
+            manifest = json.loads(mf.read_text("utf-8"))
+            # files first, required keys last: order of keys must not matter
+            reordered = {k: manifest[k] for k in reversed(list(manifest))}
+            mf.write_text(json.dumps(reordered, indent=1), encoding="utf-8")
+
+            self.assertTrue(validate_pack(tmp).ok)
+            self.assertEqual(load_pack(tmp).manifest, manifest)
+
+    def test_duplicate_pins_rejected_by_validate_and_load(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td) / "pack"
+            shutil.copytree(FIXTURE, tmp)
+            mf = tmp / "pack_manifest.json"
+            good = json.loads(mf.read_text("utf-8"))["files"]["payload.json"]
+            text = mf.read_text("utf-8").replace(
+                f'"payload.json": "{good}"',
+                f'"payload.json": "{"0" * 64}", "payload.json": "{good}"',
+            )
+            mf.write_text(text, encoding="utf-8")
+
+            codes = [iss.code for iss in validate_pack(tmp).issues]
+            self.assertIn("MANIFEST_READ_ERROR", codes)
+            with self.assertRaises(PackValidationError):
+                load_pack(tmp)
+
+            # Same file under two spellings
+            manifest = json.loads(text.replace(f'"payload.json": "{"0" * 64}", ', ""))
+            manifest["files"]["./payload.json"] = good
+            mf.write_text(json.dumps(manifest), encoding="utf-8")
+
+            found = [(iss.code, iss.path) for iss in validate_pack(tmp).issues]
+            self.assertEqual(found, [("DUPLICATE_PIN", "./payload.json")])
+            with self.assertRaisesRegex(PackValidationError, "DUPLICATE_PIN"):
+                load_pack(tmp)
+
+    def test_repeated_keys_outside_files_keep_last_value(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td) / "pack"
+            shutil.copytree(FIXTURE, tmp)
+            mf = tmp / "pack_manifest.json"
+            body = mf.read_text("utf-8").strip()[1:]
+            # As with json.loads in v2.0.1, the last value wins outside files
+            mf.write_text(
+                '{"pack_id": "",' + body[:-1]
+                + ', "engine_compat": {"min_version": "x", "min_version": "1.0.0"}}',
+                encoding="utf-8",
+            )
+            self.assertEqual(validate_pack(tmp).issues, ())
+            self.assertEqual(load_pack(tmp).manifest["engine_compat"], {"min_version": "1.0.0"})
+
+            # Repeated unsafe files keys fail both paths the same way
+            mf.write_text('{"files": {"../x": "1", "../x": "2"},' + body, encoding="utf-8")
+            codes = [iss.code for iss in validate_pack(tmp).issues]
+            self.assertEqual(codes, ["PATH_UNSAFE", "MANIFEST_READ_ERROR"])
+            with self.assertRaisesRegex(PackValidationError, "MANIFEST_READ_ERROR"):
+                load_pack(tmp)
+
+    def test_malformed_manifest_reported(self):
+        with tempfile.TemporaryDirectory() as td:
+            tmp = Path(td) / "pack"
+            shutil.copytree(FIXTURE, tmp)
+            mf = tmp / "pack_manifest.json"
+            mf.write_text(mf.read_text("utf-8").rstrip().rstrip("}"), encoding="utf-8")
+
+            codes = [iss.code for iss in validate_pack(tmp).issues]
+            self.assertEqual(codes[-1], "MANIFEST_READ_ERROR")
+
 
 if __name__ == "__main__":
     unittest.main()
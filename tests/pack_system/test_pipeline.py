@@ -0,0 +1,161 @@
+import hashlib
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from manifestinx.pack_system import load_pack
+from manifestinx.pipeline import LRUCache, PipelineError, load_pipeline
+
+
+def _write_pack(root: Path, graph: dict, extra: dict) -> None:
+    files = {"graph.json": graph, **extra}
+    pins = {}
+    for rel, obj in files.items():
+        raw = json.dumps(obj).encode("utf-8")
+        (root / rel).write_bytes(raw)
+        pins[rel] = hashlib.sha256(raw).hexdigest()
+    manifest = {
+        "schema_version": "pack_manifest_v0.1",
+        "pack_id": "pipeline_pack",
+        "files": pins,
+        "entrypoints": {"pipeline": "graph.json"},
+    }
+    (root / "pack_manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+
+GRAPH = {
+    "schema_version": "pipeline_v0.1",
+    "stages": [
+        {"id": "upper", "transform": "upper", "inputs": ["$input"]},
+        {"id": "length", "transform": "length", "inputs": ["$input"]},
+        {"id": "join", "transform": "join", "inputs": ["upper", "length"], "config": "join.json"},
+    ],
+    "output": "join",
+}
+
+TRANSFORMS = {
+    "upper": lambda inputs, cfg: inputs[0].upper(),
+    "length": lambda inputs, cfg: len(inputs[0]),
+    "join": lambda inputs, cfg: f"{inputs[0]}{cfg['sep']}{inputs[1]}",
+}
+
+
+class TestPipeline(unittest.TestCase):
+    def test_runs_in_topological_order(self):
+        ran: list[str] = []
+        lock = threading.Lock()
+
+        def record(name):
+            def fn(inputs, cfg):
+                with lock:
+                    ran.append(name)
+                return TRANSFORMS[name](inputs, cfg)
+            return fn
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_pack(root, GRAPH, {"join.json": {"sep": ":"}})
+            pipe = load_pipeline(load_pack(root), "pipeline", {n: record(n) for n in TRANSFORMS})
+
+            self.assertEqual(pipe.run(["ab", "xyz"]), ["AB:2", "XYZ:3"])
+            # join sees both inputs only after upper and length have run
+            self.assertEqual(sorted(ran[:4]), ["length", "length", "upper", "upper"])
+            self.assertEqual(ran[4:], ["join", "join"])
+
+    def test_memoizes_unchanged_stages(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_pack(root, GRAPH, {"join.json": {"sep": ":"}})
+            pipe = load_pipeline(load_pack(root), "pipeline", TRANSFORMS)
+            pipe.run(["ab", "xyz"])
+            self.assertEqual((pipe.hits, pipe.misses), (0, 6))
+
+            pipe.run(["ab", "new"])
+            self.assertEqual((pipe.hits, pipe.misses), (3, 9))
+
+            # A changed config pin only recomputes the dependent stage
+            _write_pack(root, GRAPH, {"join.json": {"sep": "-"}})
+            pipe2 = load_pipeline(load_pack(root), "pipeline", TRANSFORMS, cache=pipe.cache)
+            self.assertEqual(pipe2.run(["ab"]), ["AB-2"])
+            self.assertEqual((pipe2.hits, pipe2.misses), (2, 1))
+
+    def test_transform_version_invalidates_cached_stage(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_pack(root, GRAPH, {"join.json": {"sep": ":"}})
+            handle = load_pack(root)
+            pipe = load_pipeline(handle, "pipeline", TRANSFORMS, transform_versions={"length": "1"})
+            pipe.run(["ab"])
+
+            # Same cache, new length implementation: length and join recompute
+            transforms = {**TRANSFORMS, "length": lambda inputs, cfg: 2 * len(inputs[0])}
+            pipe2 = load_pipeline(
+                handle, "pipeline", transforms, cache=pipe.cache, transform_versions={"length": "2"}
+            )
+            self.assertEqual(pipe2.run(["ab"]), ["AB:4"])
+            self.assertEqual((pipe2.hits, pipe2.misses), (1, 2))
+
+    def test_default_cache_is_bounded(self):
+        cache = LRUCache(maxsize=2)
+        cache["a"], cache["b"] = 1, 2
+        cache.get("a")
+        cache["c"] = 3
+        self.assertEqual(sorted(cache), ["a", "c"])
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_pack(root, GRAPH, {"join.json": {"sep": ":"}})
+            pipe = load_pipeline(load_pack(root), "pipeline", TRANSFORMS)
+            self.assertIsInstance(pipe.cache, LRUCache)
+
+    def test_stage_starts_when_its_inputs_are_ready(self):
+        # "slow" blocks until "fast_next" has run; with a level barrier
+        # fast_next would wait for slow and the event would time out.
+        graph = {
+            "schema_version": "pipeline_v0.1",
+            "stages": [
+                {"id": "slow", "transform": "slow", "inputs": ["$input"]},
+                {"id": "fast", "transform": "ident", "inputs": ["$input"]},
+                {"id": "fast_next", "transform": "signal", "inputs": ["fast"]},
+                {"id": "join", "transform": "pair", "inputs": ["slow", "fast_next"]},
+            ],
+            "output": "join",
+        }
+        ev = threading.Event()
+
+        def signal(inputs, cfg):
+            ev.set()
+            return inputs[0]
+
+        transforms = {
+            "slow": lambda inputs, cfg: ev.wait(2),
+            "ident": lambda inputs, cfg: inputs[0],
+            "signal": signal,
+            "pair": lambda inputs, cfg: [inputs[0], inputs[1]],
+        }
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_pack(root, graph, {})
+            pipe = load_pipeline(load_pack(root), "pipeline", transforms, max_workers=4)
+            self.assertEqual(pipe.run(["x"]), [[True, "x"]])
+
+    def test_cycle_rejected(self):
+        graph = {
+            "schema_version": "pipeline_v0.1",
+            "stages": [
+                {"id": "a", "transform": "upper", "inputs": ["b"]},
+                {"id": "b", "transform": "upper", "inputs": ["a"]},
+            ],
+            "output": "a",
+        }
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_pack(root, graph, {})
+            with self.assertRaises(PipelineError):
+                load_pipeline(load_pack(root), "pipeline", TRANSFORMS)
+
+
+if __name__ == "__main__":
+    unittest.main()